@@ -608,7 +608,7 @@ class HandlerRegistry(object):
                 self._prefixed_spec_path(), methods=["GET"], endpoint=swagger_endpoint
             )
             def get_swagger():
-                swagger = self.swagger_generator.generate_swagger(
+                swagger = self.swagger_generator.generate_swagger_to_serve(
                     registry=self, host=request.host_url.rstrip("/")
                 )
                 return response(data=swagger)
@@ -146,6 +146,7 @@ class AuthenticatorConverterRegistry(ConverterRegistry):
         :param AuthenticatorConverter converter:
         """
         self._type_map[converter.AUTHENTICATOR_TYPE] = converter
+        self._version += 1
 
     def register_types(self, converters):
         """
@@ -8,6 +8,7 @@
     :license: MIT, see LICENSE for details.
 """
 import copy
+import functools
 import re
 from collections import namedtuple, OrderedDict
 
@@ -70,6 +71,31 @@ def get_response_description(schema):
         return get_swagger_title(schema)
 
 
+_IMMUTABLE_TYPES = (str, int, float, type(None))
+
+
+def clone_jsonschema(obj):
+    """Returns a copy of the JSONSchema `obj` that shares no mutable objects with it
+
+    Converters return plain dicts, lists and scalars, plus whatever values they
+    pass through (e.g. a field's default), so this rebuilds dicts and lists
+    itself and only falls back to `copy.deepcopy` for anything else mutable.
+    That's cheaper than deep copying the whole thing, which memoizes and
+    dispatches on the type of every object.
+
+    :param obj:
+    :rtype: dict
+    """
+    if type(obj) is dict:
+        return {key: clone_jsonschema(value) for key, value in obj.items()}
+    elif type(obj) is list:
+        return [clone_jsonschema(value) for value in obj]
+    elif isinstance(obj, _IMMUTABLE_TYPES):
+        return obj
+    else:
+        return copy.deepcopy(obj)
+
+
 def flatten(schema, base):
     """
     Recursively flattens a JSONSchema to a dictionary of keyed JSONSchemas,
@@ -115,39 +141,95 @@ def flatten(schema, base):
     objects replaces with references, and the second item is the flattened
     definitions dictionary.
     """
-    schema = copy.deepcopy(schema)
     definitions = {}
     schema = _flatten(schema=schema, definitions=definitions, base=base)
     return schema, definitions
 
 
 def _flatten(schema, definitions, base):
+    # This walks the tree with an explicit stack instead of recursing, so deeply
+    # nested schemas can't hit the recursion limit. Nodes are still finished in
+    # the same order recursion would finish them - children first, in order -
+    # so clashing titles resolve the same way.
+    #
+    # This never mutates `schema`, and shares nothing mutable with it, so
+    # changing the returned definitions can't change the schema (or the
+    # marshmallow fields a converter took values like defaults from).
+    result = [None]
+    stack = [(schema, result, 0, False)]
+
+    while stack:
+        node, container, key, children_done = stack.pop()
+
+        if not children_done:
+            node, children = _copy_with_children(node)
+            stack.append((node, container, key, True))
+            stack.extend(
+                (child, child_container, child_key, False)
+                for child, child_container, child_key in reversed(children)
+            )
+            continue
+
+        if sw.title in node:
+            definitions_key = get_key(node)
+            definitions[definitions_key] = node
+            node = {sw.ref: create_ref(base, definitions_key)}
+
+        container[key] = node
+
+    return result[0]
+
+
+def _copy_with_children(schema):
+    """
+    Returns a copy of `schema` whose nested schemas can be replaced, along with
+    a list of (nested schema, container, key) for each of them.
+
+    :param dict schema:
+    :rtype: tuple(dict, list)
+    """
     schema_type = schema.get(sw.type_)
     subschema_keyword = _get_subschema_keyword(schema)
 
     if schema_type == sw.object_:
-        properties = schema.get(sw.properties, {})
-        for key, prop in properties.items():
-            properties[key] = _flatten(schema=prop, definitions=definitions, base=base)
+        # Most schemas only have scalar fields. Nothing in those needs replacing,
+        # so there's no need to visit their properties one by one.
+        if sw.properties not in schema or not any(
+            _needs_flattening(prop) for prop in schema[sw.properties].values()
+        ):
+            return clone_jsonschema(schema), []
+        copied = _clone_except(schema, sw.properties)
+        properties = copied[sw.properties] = dict(schema[sw.properties])
+        return copied, [(prop, properties, key) for key, prop in properties.items()]
 
     elif schema_type == sw.array:
-        schema[sw.items] = _flatten(
-            schema=schema[sw.items], definitions=definitions, base=base
-        )
+        copied = _clone_except(schema, sw.items)
+        return copied, [(schema[sw.items], copied, sw.items)]
 
     elif subschema_keyword:
-        subschemas = schema[subschema_keyword]
-        for i, subschema in enumerate(subschemas):
-            subschemas[i] = _flatten(
-                schema=subschema, definitions=definitions, base=base
-            )
+        copied = _clone_except(schema, subschema_keyword)
+        subschemas = copied[subschema_keyword] = list(schema[subschema_keyword])
+        return copied, [
+            (subschema, subschemas, i) for i, subschema in enumerate(subschemas)
+        ]
+
+    return clone_jsonschema(schema), []
 
-    if sw.title in schema:
-        definitions_key = get_key(schema)
-        definitions[definitions_key] = schema
-        schema = {sw.ref: create_ref(base, definitions_key)}
 
-    return schema
+def _clone_except(schema, key):
+    # The value at `key` is replaced by the caller once its children are done
+    return {
+        k: (value if k == key else clone_jsonschema(value))
+        for k, value in schema.items()
+    }
+
+
+def _needs_flattening(schema):
+    return (
+        sw.title in schema
+        or schema.get(sw.type_) in (sw.object_, sw.array)
+        or _get_subschema_keyword(schema) is not None
+    )
 
 
 def _get_subschema_keyword(schema):
@@ -160,6 +242,9 @@ _PATH_REGEX = re.compile("<((?P<type>.+?):)?(?P<name>.+?)>")
 PathArgument = namedtuple("PathArgument", ["name", "type"])
 
 
+# Paths are formatted again every time a specification is generated, and the
+# result is immutable, so it's safe to share.
+@functools.lru_cache(maxsize=1024)
 def format_path_for_swagger(path):
     """
     Flask and Swagger represent paths differently - this parses a Flask path
@@ -169,17 +254,19 @@ def format_path_for_swagger(path):
     :param str path:
     :rtype: tuple(str, tuple(_PathArgument))
     """
-    matches = list(_PATH_REGEX.finditer(path))
+    parts = []
+    args = []
+    last_end = 0
 
-    args = tuple(
-        PathArgument(name=match.group("name"), type=match.group("type") or "string")
-        for match in matches
-    )
+    # Collect the arguments and rewrite the path in the same scan
+    for match in _PATH_REGEX.finditer(path):
+        name = match.group("name")
+        parts.extend((path[last_end : match.start()], "{", name, "}"))
+        args.append(PathArgument(name=name, type=match.group("type") or "string"))
+        last_end = match.end()
 
-    subbed_path = _PATH_REGEX.sub(
-        repl=lambda match: "{{{}}}".format(match.group("name")), string=path
-    )
-    return subbed_path, args
+    parts.append(path[last_end:])
+    return "".join(parts), tuple(args)
 
 
 def verify_parameters_are_the_same(a, b):
@@ -209,12 +296,17 @@ def get_unique_schema_definitions(
     :param typing.Callable[[marshmallow.Schema], dict] request_body_converter:
     :rtype: dict
     """
-    all_schemas = set()
-
+    # Schemas are deduplicated by identity. Every schema is referenced by the
+    # registry while we're in here, so ids can't be reused.
+    seen = set()
     converted = []
 
-    all_schemas.add(default_response_schema)
-    converted.append(response_converter(default_response_schema))
+    def register(schema, converter):
+        if id(schema) not in seen:
+            seen.add(id(schema))
+            converted.append(converter(schema))
+
+    register(default_response_schema, response_converter)
 
     for d in iterate_path_definitions(paths=registry.paths):
         if d.response_body_schema:
@@ -224,17 +316,10 @@ def get_unique_schema_definitions(
                     # for a schema
                     continue
 
-                if schema not in all_schemas:
-                    converted.append(response_converter(schema))
-                all_schemas.add(schema)
+                register(schema, response_converter)
 
         if d.request_body_schema:
-            schema = d.request_body_schema
-
-            if schema not in all_schemas:
-                converted.append(request_body_converter(schema))
-
-            all_schemas.add(schema)
+            register(d.request_body_schema, request_body_converter)
 
     flattened = {}
 
@@ -246,20 +331,55 @@ def get_unique_schema_definitions(
 
 
 def get_unique_authenticators(registry):
-    authenticators = set(
-        authenticator
-        for d in iterate_path_definitions(paths=registry.paths)
-        for authenticator in d.authenticators
-        if authenticator is not None and authenticator is not USE_DEFAULT
-    )
+    """Returns every distinct authenticator used by `registry`, in the order they're first used
+
+    Authenticators are compared by identity, so a user-defined __hash__ or
+    __eq__ is never called.
+
+    :param flask_rebar.rebar.HandlerRegistry registry:
+    :rtype: list[flask_rebar.authenticators.Authenticator]
+    """
+    seen = set()
+    authenticators = []
+
+    def add(authenticator):
+        if authenticator is not None and id(authenticator) not in seen:
+            seen.add(id(authenticator))
+            authenticators.append(authenticator)
+
+    for d in iterate_path_definitions(paths=registry.paths):
+        for authenticator in d.authenticators:
+            if authenticator is not USE_DEFAULT:
+                add(authenticator)
 
     for authenticator in registry.default_authenticators:
-        if authenticator is not None:
-            authenticators.add(authenticator)
+        add(authenticator)
 
     return authenticators
 
 
+def get_registry_fingerprint(registry):
+    """Returns a value that compares equal for two states of `registry` that produce the same specification
+
+    Path definitions are immutable and replaced whenever a handler is added, so
+    this is much cheaper to build and compare than actually generating the
+    specification. It is used by generators to decide when a cached
+    specification is stale.
+
+    :param flask_rebar.rebar.HandlerRegistry registry:
+    :rtype: tuple
+    """
+    return (
+        tuple(
+            (path, method, definition)
+            for path, methods in registry.paths.items()
+            for method, definition in methods.items()
+        ),
+        registry.default_headers_schema,
+        tuple(registry.default_authenticators),
+    )
+
+
 def iterate_path_definitions(paths):
     """Iterate over all `PathDefinition` instances in `paths`
 
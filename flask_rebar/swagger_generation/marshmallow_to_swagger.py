@@ -558,10 +558,23 @@ class ConverterRegistry(object):
     Marshmallow types.
     """
 
+    # A class attribute, so subclasses that don't call __init__ still have it
+    _version = 0
+
     def __init__(self):
         self._type_map = {}
         self._validator_map = {}
 
+    @property
+    def version(self):
+        """
+        Incremented every time a converter is registered, so that anything
+        caching conversions can tell when they might have changed.
+
+        :rtype: int
+        """
+        return self._version
+
     def register_type(self, converter):
         """
         Registers a converter.
@@ -569,6 +582,7 @@ class ConverterRegistry(object):
         :param MarshmallowConverter converter:
         """
         self._type_map[converter.MARSHMALLOW_TYPE] = converter
+        self._version += 1
 
     def register_types(self, converters):
         """
@@ -11,6 +11,8 @@
 import abc
 import functools
 
+from flask import json
+
 from flask_rebar.swagger_generation import swagger_words as sw
 from flask_rebar.swagger_generation.authenticator_to_swagger import (
     authenticator_converter_registry as global_authenticator_converter_registry,
@@ -47,6 +49,31 @@ class SwaggerGeneratorI(abc.ABC):
         :return:
         """
 
+    def generate_swagger_to_serve(self, registry, host=None):
+        """
+        Generate the swagger definition served by a registry's spec_path.
+
+        The result is only ever encoded, never modified, so generators can
+        return the same object for as long as it's up to date. By default, this
+        is just :meth:`generate_swagger`.
+        :param registry:
+        :param host:
+        :return:
+        """
+        return self.generate_swagger(registry=registry, host=host)
+
+    def generate_swagger_bytes(self, registry, host=None):
+        """
+        Generate a swagger definition as a compact, encoded JSON document.
+
+        By default, this just encodes :meth:`generate_swagger`.
+        :param registry:
+        :param host:
+        :rtype: bytes
+        """
+        swagger = self.generate_swagger(registry=registry, host=host)
+        return json.dumps(swagger, separators=(",", ":")).encode("utf-8")
+
     @abc.abstractmethod
     def register_flask_converter_to_swagger_type(self, flask_converter, swagger_type):
         """
@@ -80,7 +107,8 @@ class SwaggerGenerator(SwaggerGeneratorI):
         to the corresponding types of swagger objects. These default to the
         global registries.
 
-    :param marshmallow.Schema default_response_schema: Schema to use as the default of all responses
+    :param marshmallow.Schema default_response_schema: Schema to use as the default of all responses.
+        Defaults to a new :class:`flask_rebar.validation.Error` instance.
     """
 
     _open_api_version = None
@@ -95,7 +123,7 @@ class SwaggerGenerator(SwaggerGeneratorI):
         request_body_converter_registry=None,
         headers_converter_registry=None,
         response_converter_registry=None,
-        default_response_schema=Error(),
+        default_response_schema=None,
         authenticator_converter_registry=None,
         include_hidden=False,
     ):
@@ -103,6 +131,8 @@ class SwaggerGenerator(SwaggerGeneratorI):
         self.title = title
         self.version = version
         self.description = description
+        self._converter_registries = []
+        self._converter_caches = []
         self._query_string_converter = self._create_converter(
             query_string_converter_registry,
             global_query_string_converter_registry,
@@ -139,7 +169,9 @@ class SwaggerGenerator(SwaggerGeneratorI):
             openapi_major_version,
         )
 
-        self.default_response_schema = default_response_schema
+        self.default_response_schema = (
+            default_response_schema if default_response_schema is not None else Error()
+        )
 
     def _get_info(self):
         return {
@@ -151,25 +183,74 @@ class SwaggerGenerator(SwaggerGeneratorI):
     def _create_converter(
         self, converter_registry, default_registry, openapi_major_version
     ):
-        return functools.partial(
-            (converter_registry or default_registry).convert,
-            openapi_version=openapi_major_version,
+        converter_registry = converter_registry or default_registry
+        self._converter_registries.append(converter_registry)
+        convert = functools.partial(
+            converter_registry.convert, openapi_version=openapi_major_version
         )
 
+        # The same schema is usually referenced by many handlers, so remember
+        # what it converted to. Marshmallow objects can define their own
+        # __hash__/__eq__, so key by identity and hold on to the object to make
+        # sure its id isn't reused while it's cached.
+        cache = {}
+        self._converter_caches.append(cache)
+
+        def converter(obj):
+            cached = cache.get(id(obj))
+            if cached is not None and cached[0] is obj:
+                return cached[1]
+            converted = convert(obj)
+            cache[id(obj)] = (obj, converted)
+            return converted
+
+        return converter
+
+    def _clear_converter_caches(self):
+        """
+        Forgets memoized conversions. The converter registries can be extended at
+        any time, so this is called before generating a new specification.
+        """
+        for cache in self._converter_caches:
+            cache.clear()
+
     def _create_authenticator_converter(
         self, converter_registry, default_registry, openapi_major_version
     ):
+        converter_registry = converter_registry or default_registry
+        self._converter_registries.append(converter_registry)
         registry = type("authenticator_converter_registry", (), {})
         registry.get_security_schemes = functools.partial(
-            (converter_registry or default_registry).get_security_schemes,
+            converter_registry.get_security_schemes,
             openapi_version=openapi_major_version,
         )
         registry.get_security_requirements = functools.partial(
-            (converter_registry or default_registry).get_security_requirements,
+            converter_registry.get_security_requirements,
             openapi_version=openapi_major_version,
         )
         return registry
 
+    def _get_converter_fingerprint(self):
+        """
+        Returns a value that compares equal for two states of the converter
+        registries and Flask converter mapping that convert things the same way.
+
+        :rtype: tuple
+        """
+        versions = []
+        for registry in self._converter_registries:
+            version = getattr(registry, "version", None)
+            if version is None:
+                # There's no telling when a registry that isn't a
+                # ConverterRegistry changes, so never consider it unchanged.
+                return object()
+            versions.append(version)
+
+        return (
+            tuple(versions),
+            tuple(self.flask_converters_to_swagger_types.items()),
+        )
+
     def get_open_api_version(self):
         return self._open_api_version
 
@@ -9,7 +9,7 @@
 """
 from __future__ import unicode_literals
 
-import copy
+from flask import current_app, has_app_context, json
 
 from flask_rebar.swagger_generation import swagger_words as sw
 from flask_rebar.authenticators import USE_DEFAULT
@@ -22,12 +22,17 @@ from flask_rebar.swagger_generation.generator_utils import (
     get_unique_schema_definitions,
     get_ref_schema,
     get_unique_authenticators,
+    get_registry_fingerprint,
+    clone_jsonschema,
 )
 from flask_rebar.swagger_generation.marshmallow_to_swagger import get_swagger_title
-from flask_rebar.validation import Error
 from flask_rebar.swagger_generation.swagger_generator import SwaggerGenerator
 
 
+# How many specifications (e.g. for different hosts) a generator keeps at once
+_MAX_CACHED_SWAGGERS = 8
+
+
 class SwaggerV2Generator(SwaggerGenerator):
     """
     Generates a v2.0 Swagger specification from a Rebar object.
@@ -74,7 +79,7 @@ class SwaggerV2Generator(SwaggerGenerator):
         headers_converter_registry=None,
         response_converter_registry=None,
         tags=None,
-        default_response_schema=Error(),
+        default_response_schema=None,
         authenticator_converter_registry=None,
     ):
         super(SwaggerV2Generator, self).__init__(
@@ -95,10 +100,19 @@ class SwaggerV2Generator(SwaggerGenerator):
         self.produces = produces
         self.tags = tags
         self._ref_base = "#/definitions"
+        self._cached_swaggers = {}
+        self._response_definitions = {}
 
     def generate_swagger(self, registry, host=None):
         return self.generate(registry=registry, host=host)
 
+    def generate_swagger_to_serve(self, registry, host=None):
+        _, (_, swagger, _) = self._get_cached_swagger(registry=registry, host=host)
+        return swagger
+
+    def generate_swagger_bytes(self, registry, host=None):
+        return self.generate_bytes(registry=registry, host=host)
+
     def generate(
         self,
         registry,
@@ -121,21 +135,139 @@ class SwaggerV2Generator(SwaggerGenerator):
         :param bool sort_keys: Use OrderedDicts sorted by keys instead of dicts
         :rtype: dict
         """
+        host, schemes, consumes, produces = self._get_generate_args(
+            host=host, schemes=schemes, consumes=consumes, produces=produces
+        )
+        return self._generate(
+            registry=registry,
+            host=host,
+            schemes=schemes,
+            consumes=consumes,
+            produces=produces,
+            sort_keys=sort_keys,
+        )
+
+    def generate_bytes(
+        self,
+        registry,
+        host=None,
+        schemes=None,
+        consumes=None,
+        produces=None,
+        sort_keys=True,
+    ):
+        """Generate a swagger specification from the provided `registry`, encoded as compact JSON
+
+        Takes the same arguments as :meth:`generate`. The specification is
+        cached, along with its encoding for the current Flask app, and returned
+        for subsequent calls with the same arguments until the handler registry,
+        the converter registries or this generator's settings change. Schemas
+        are assumed not to change once they've been registered with a handler,
+        so changes to them (e.g. reassigning `__swagger_title__`) aren't picked
+        up.
+
+        :rtype: bytes
+        """
+        cache_args, (cache_key, swagger, encoded) = self._get_cached_swagger(
+            registry=registry,
+            host=host,
+            schemes=schemes,
+            consumes=consumes,
+            produces=produces,
+            sort_keys=sort_keys,
+        )
+
+        # flask.json encodes with the current app's JSON settings
+        app = current_app._get_current_object() if has_app_context() else None
+        if encoded is None or encoded[0] is not app:
+            encoded = (app, json.dumps(swagger, separators=(",", ":")).encode("utf-8"))
+            self._cached_swaggers[cache_args] = (cache_key, swagger, encoded)
+
+        return encoded[1]
+
+    def _get_cached_swagger(
+        self,
+        registry,
+        host=None,
+        schemes=None,
+        consumes=None,
+        produces=None,
+        sort_keys=True,
+    ):
+        """
+        Returns the arguments the specification is cached under, and the cached
+        (key, specification, (app, encoded specification)), generating the
+        specification first if it's stale. The encoding is None until
+        :meth:`generate_bytes` asks for it.
+
+        The specification is shared by every caller, so it must not be modified.
+        """
+        host, schemes, consumes, produces = self._get_generate_args(
+            host=host, schemes=schemes, consumes=consumes, produces=produces
+        )
+
+        cache_args = (host, tuple(schemes), tuple(consumes), tuple(produces), sort_keys)
+        cache_key = (
+            get_registry_fingerprint(registry),
+            self._get_converter_fingerprint(),
+            self._get_info(),
+            list(self.tags or ()),
+            self.default_response_schema,
+        )
+        # An app is often reached under a few hostnames (e.g. an internal one
+        # for health checks), so a specification is cached per set of arguments.
+        # Each entry is read and replaced in one go, so that concurrent requests
+        # can't pair one's key with the other's specification.
+        cached = self._cached_swaggers.get(cache_args)
+        if cached is not None and cached[0] == cache_key:
+            return cache_args, cached
+
+        swagger = self._generate(
+            registry=registry,
+            host=host,
+            schemes=schemes,
+            consumes=consumes,
+            produces=produces,
+            sort_keys=sort_keys,
+        )
+        cached = (cache_key, swagger, None)
+
+        # The host comes from the request, so don't let the cache grow forever
+        if len(self._cached_swaggers) >= _MAX_CACHED_SWAGGERS:
+            self._cached_swaggers.clear()
+        self._cached_swaggers[cache_args] = cached
+
+        return cache_args, cached
+
+    def _get_generate_args(self, host, schemes, consumes, produces):
+        if host and "://" in host:
+            _, _, host = host.partition("://")
+
+        return (
+            host or self.host,
+            list(schemes or self.schemes),
+            list(consumes or self.consumes),
+            list(produces or self.produces),
+        )
+
+    def _generate(self, registry, host, schemes, consumes, produces, sort_keys):
+        self._clear_generation_caches()
+
+        get_security_schemes = self.authenticator_converter.get_security_schemes
+        get_security_requirements = (
+            self.authenticator_converter.get_security_requirements
+        )
 
         security_definitions = {}
         authenticators = get_unique_authenticators(registry)
         for authenticator in authenticators:
             # We should probably eventually check that scheme with the same name are identical
             # rather than just overwriting the existing scheme definition.
-            security_definitions.update(
-                self.authenticator_converter.get_security_schemes(authenticator)
-            )
+            security_definitions.update(get_security_schemes(authenticator))
 
         default_security = []
         for authenticator in registry.default_authenticators:
-            default_security.extend(
-                self.authenticator_converter.get_security_requirements(authenticator)
-            )
+            default_security.extend(get_security_requirements(authenticator))
 
         definitions = get_unique_schema_definitions(
             registry=registry,
@@ -150,16 +282,13 @@ class SwaggerV2Generator(SwaggerGenerator):
             default_security=default_security,
         )
 
-        if host and "://" in host:
-            _, _, host = host.partition("://")
-
         swagger = {
             sw.swagger: self.get_open_api_version(),
             sw.info: self._get_info(),
-            sw.host: host or self.host,
-            sw.schemes: list(schemes or self.schemes),
-            sw.consumes: list(consumes or self.consumes),
-            sw.produces: list(produces or self.produces),
+            sw.host: host,
+            sw.schemes: schemes,
+            sw.consumes: consumes,
+            sw.produces: produces,
             sw.security_definitions: security_definitions,
             sw.paths: paths,
             sw.definitions: definitions,
@@ -178,29 +307,54 @@ class SwaggerV2Generator(SwaggerGenerator):
         return swagger
 
     def _get_paths(self, paths, default_headers_schema, default_security=None):
-        path_definitions = {}
-
+        # Group the Flask paths by the Swagger path they map to
+        flask_paths_by_spec_path = {}
         for path, methods in paths.items():
             spec_path, path_args = format_path_for_swagger(path)
+            flask_paths_by_spec_path.setdefault(spec_path, []).append(
+                (path_args, methods)
+            )
 
-            # Different Flask paths might correspond to the same Swagger path
-            # because of Flask URL path converters. In this case, let's just
-            # work off the same path definitions.
-            if spec_path in path_definitions:
-                path_definition = path_definitions[spec_path]
-            else:
-                path_definitions[spec_path] = path_definition = {}
+        return {
+            spec_path: self._get_path_definition(
+                flask_paths,
+                default_headers_schema=default_headers_schema,
+                default_security=default_security,
+            )
+            for spec_path, flask_paths in flask_paths_by_spec_path.items()
+        }
 
+    def _get_path_definition(
+        self, flask_paths, default_headers_schema, default_security=None
+    ):
+        """
+        Builds the definition of a single Swagger path.
+
+        :param Sequence[tuple] flask_paths:
+            (path arguments, methods) for every Flask path that maps to this Swagger path
+        :rtype: dict
+        """
+        path_definition = {}
+
+        ref_base = self._ref_base
+        get_security_requirements = (
+            self.authenticator_converter.get_security_requirements
+        )
+
+        # These are the same for every method, so only work them out once
+        default_response_description = get_response_description(
+            self.default_response_schema
+        )
+        default_response_ref = create_ref(
+            ref_base, get_swagger_title(self.default_response_schema)
+        )
+
+        # Different Flask paths might correspond to the same Swagger path
+        # because of Flask URL path converters. In this case, let's just
+        # work off the same path definitions.
+        for path_args, methods in flask_paths:
             if path_args:
-                path_params = [
-                    {
-                        sw.name: path_arg.name,
-                        sw.required: True,
-                        sw.in_: sw.path,
-                        sw.type_: self.flask_converters_to_swagger_types[path_arg.type],
-                    }
-                    for path_arg in path_args
-                ]
+                path_params = self._get_path_parameters(path_args)
 
                 # We have to check for an ugly case here. If different Flask
                 # paths that map to the same Swagger path use different URL
@@ -216,104 +370,129 @@ class SwaggerV2Generator(SwaggerGenerator):
             for method, d in methods.items():
                 responses_definition = {
                     sw.default: {
-                        sw.description: get_response_description(
-                            self.default_response_schema
-                        ),
-                        sw.schema: {
-                            sw.ref: create_ref(
-                                self._ref_base,
-                                get_swagger_title(self.default_response_schema),
-                            )
-                        },
+                        sw.description: default_response_description,
+                        sw.schema: {sw.ref: default_response_ref},
                     }
                 }
 
                 if d.response_body_schema:
                     for status_code, schema in d.response_body_schema.items():
                         if schema is not None:
-                            response_definition = {
-                                sw.description: get_response_description(schema),
-                                sw.schema: get_ref_schema(self._ref_base, schema),
-                            }
-
-                            responses_definition[str(status_code)] = response_definition
+                            responses_definition[
+                                str(status_code)
+                            ] = self._get_response_definition(schema)
                         else:
                             responses_definition[str(status_code)] = {
                                 sw.description: "No response body."
                             }
 
-                parameters_definition = []
+                parameters_definition = list(
+                    self._iter_parameters(d, default_headers_schema, ref_base)
+                )
 
-                if d.query_string_schema:
-                    parameters_definition.extend(
-                        self._convert_jsonschema_to_list_of_parameters(
-                            self._query_string_converter(d.query_string_schema),
-                            in_=sw.query,
-                        )
-                    )
-
-                if d.request_body_schema:
-                    schema = d.request_body_schema
-
-                    parameters_definition.append(
-                        {
-                            sw.name: schema.__class__.__name__,
-                            sw.in_: sw.body,
-                            sw.required: True,
-                            sw.schema: get_ref_schema(self._ref_base, schema),
-                        }
-                    )
-
-                if d.headers_schema is USE_DEFAULT and default_headers_schema:
-                    parameters_definition.extend(
-                        self._convert_jsonschema_to_list_of_parameters(
-                            self._headers_converter(default_headers_schema),
-                            in_=sw.header,
-                        )
-                    )
-                elif (
-                    d.headers_schema is not USE_DEFAULT and d.headers_schema is not None
-                ):
-                    parameters_definition.extend(
-                        self._convert_jsonschema_to_list_of_parameters(
-                            self._headers_converter(d.headers_schema), in_=sw.header
-                        )
-                    )
-
-                method_lower = method.lower()
-                path_definition[method_lower] = {
+                path_definition[method.lower()] = operation = {
                     sw.operation_id: d.endpoint or get_swagger_title(d.func),
                     sw.responses: responses_definition,
                 }
 
                 if d.func.__doc__:
-                    path_definition[method_lower][sw.description] = d.func.__doc__
+                    operation[sw.description] = d.func.__doc__
 
                 if parameters_definition:
-                    path_definition[method_lower][sw.parameters] = parameters_definition
+                    operation[sw.parameters] = parameters_definition
 
                 if not d.authenticators:
-                    path_definition[method_lower][sw.security] = []
+                    operation[sw.security] = []
                 else:
                     non_default = False
                     security = []
                     for authenticator in d.authenticators:
                         if authenticator is not USE_DEFAULT:
-                            security.extend(
-                                self.authenticator_converter.get_security_requirements(
-                                    authenticator
-                                )
-                            )
+                            security.extend(get_security_requirements(authenticator))
                             non_default = True
                         elif default_security is not None:
                             security.extend(default_security)
                     if non_default:
-                        path_definition[method_lower][sw.security] = security
+                        operation[sw.security] = security
 
                 if d.tags:
-                    path_definition[method_lower][sw.tags] = d.tags
+                    operation[sw.tags] = d.tags
+
+        return path_definition
+
+    def _clear_generation_caches(self):
+        """
+        Forgets everything memoized while generating the previous specification.
+        """
+        self._clear_converter_caches()
+        self._response_definitions.clear()
+
+    def _get_path_parameters(self, path_args):
+        flask_types = self.flask_converters_to_swagger_types
+        return [
+            {
+                sw.name: path_arg.name,
+                sw.required: True,
+                sw.in_: sw.path,
+                sw.type_: flask_types.get(path_arg.type, sw.string),
+            }
+            for path_arg in path_args
+        ]
+
+    def _get_response_definition(self, schema):
+        # The same schema is often used for many responses, so its description
+        # and reference are only worked out once per generation. Keyed by id like
+        # the converters, holding on to the schema so the id can't be reused.
+        cached = self._response_definitions.get(id(schema))
+        if cached is None or cached[0] is not schema:
+            cached = (
+                schema,
+                get_response_description(schema),
+                create_ref(self._ref_base, get_swagger_title(schema)),
+            )
+            self._response_definitions[id(schema)] = cached
+        _, description, ref = cached
+
+        # Build new dicts every time, so that responses don't share objects.
+        ref_schema = {sw.ref: ref}
+        if schema.many:
+            ref_schema = {sw.type_: sw.array, sw.items: ref_schema}
+
+        return {sw.description: description, sw.schema: ref_schema}
+
+    def _iter_parameters(self, d, default_headers_schema, ref_base):
+        """
+        Yields the query string, body and header parameters of a handler.
+
+        :param flask_rebar.rebar.PathDefinition d:
+        :param marshmallow.Schema default_headers_schema:
+        :param str ref_base:
+        :rtype: Iterator[dict]
+        """
+        if d.query_string_schema:
+            yield from self._convert_jsonschema_to_list_of_parameters(
+                self._query_string_converter(d.query_string_schema), in_=sw.query
+            )
+
+        if d.request_body_schema:
+            schema = d.request_body_schema
 
-        return path_definitions
+            yield {
+                sw.name: schema.__class__.__name__,
+                sw.in_: sw.body,
+                sw.required: True,
+                sw.schema: get_ref_schema(ref_base, schema),
+            }
+
+        if d.headers_schema is USE_DEFAULT:
+            headers_schema = default_headers_schema
+        else:
+            headers_schema = d.headers_schema
+
+        if headers_schema:
+            yield from self._convert_jsonschema_to_list_of_parameters(
+                self._headers_converter(headers_schema), in_=sw.header
+            )
 
     def _convert_jsonschema_to_list_of_parameters(self, obj, in_="query"):
         """
@@ -333,7 +512,9 @@ class SwaggerV2Generator(SwaggerGenerator):
         required = obj.get("required", [])
 
         for name, prop in sorted(obj["properties"].items(), key=lambda i: i[0]):
-            parameter = copy.deepcopy(prop)
+            # Converters memoize their results, so copy them rather than sharing
+            # them between every handler that uses the schema.
+            parameter = clone_jsonschema(prop)
             parameter["required"] = name in required
             parameter["in"] = in_
             parameter["name"] = name
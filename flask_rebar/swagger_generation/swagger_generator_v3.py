@@ -21,12 +21,12 @@ from flask_rebar.swagger_generation.generator_utils import (
     recursively_convert_dict_to_ordered_dict,
     get_ref_schema,
     get_unique_authenticators,
+    clone_jsonschema,
 )
 from flask_rebar.swagger_generation.marshmallow_to_swagger import (
     get_swagger_title,
     get_schema_fields,
 )
-from flask_rebar.validation import Error
 
 
 class SwaggerV3Generator(SwaggerGenerator):
@@ -62,7 +62,7 @@ class SwaggerV3Generator(SwaggerGenerator):
         response_converter_registry=None,
         tags=None,
         servers=None,
-        default_response_schema=Error(),
+        default_response_schema=None,
         authenticator_converter_registry=None,
         include_hidden=False,
     ):
@@ -95,6 +95,7 @@ class SwaggerV3Generator(SwaggerGenerator):
         :param bool sort_keys: Use OrderedDicts sorted by keys instead of dicts
         :rtype: dict
         """
+        self._clear_converter_caches()
 
         components = self._get_components(registry=registry)
 
@@ -163,9 +164,9 @@ class SwaggerV3Generator(SwaggerGenerator):
                         sw.in_: sw.path,
                         sw.style: sw.simple,
                         sw.schema: {
-                            sw.type_: self.flask_converters_to_swagger_types[
-                                path_arg.type
-                            ]
+                            sw.type_: self.flask_converters_to_swagger_types.get(
+                                path_arg.type, sw.string
+                            )
                         },
                     }
                     for path_arg in path_args
@@ -327,7 +328,9 @@ class SwaggerV3Generator(SwaggerGenerator):
         parameters = []
 
         for prop, field in get_schema_fields(schema):
-            jsonschema = converter(field)
+            # Converters memoize their results, so copy them rather than sharing
+            # them between every handler that uses the schema.
+            jsonschema = clone_jsonschema(converter(field))
 
             # Pardon the ugliness.
             # We need the "explode" key to be at the parameters level, not at the schema level.
@@ -7,11 +7,16 @@
     :copyright: Copyright 2019 PlanGrid, Inc., see AUTHORS.
     :license: MIT, see LICENSE for details.
 """
+import copy
+import sys
 import unittest
 
+from flask_rebar.authenticators import HeaderApiKeyAuthenticator
+from flask_rebar.rebar import Rebar
 from flask_rebar.swagger_generation.generator_utils import PathArgument
 from flask_rebar.swagger_generation.generator_utils import flatten
 from flask_rebar.swagger_generation.generator_utils import format_path_for_swagger
+from flask_rebar.swagger_generation.generator_utils import get_unique_authenticators
 
 
 class TestFlatten(unittest.TestCase):
@@ -188,6 +193,65 @@ class TestFlatten(unittest.TestCase):
         self.assertEqual(schema, expected_schema)
         self.assertEqual(definitions, expected_definitions)
 
+    def test_flatten_does_not_modify_input(self):
+        input_ = {
+            "type": "object",
+            "title": "x",
+            "properties": {
+                "a": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "title": "y",
+                        "properties": {"b": {"type": "integer"}},
+                    },
+                },
+                "c": {"anyOf": [{"type": "object", "title": "z", "properties": {}}]},
+            },
+        }
+        original = copy.deepcopy(input_)
+
+        flatten(input_, base="#/definitions")
+
+        self.assertEqual(input_, original)
+
+    def test_flatten_does_not_share_objects_with_input(self):
+        default = ["a"]
+        input_ = {
+            "type": "object",
+            "title": "x",
+            "properties": {
+                "a": {"type": "array", "items": {"type": "string"}, "default": default},
+                "b": {
+                    "type": "object",
+                    "title": "y",
+                    "properties": {"c": {"type": "string", "enum": ["d"]}},
+                },
+            },
+        }
+
+        _, definitions = flatten(input_, base="#/definitions")
+        definitions["x"]["properties"]["a"]["default"].append("injected")
+        definitions["y"]["properties"]["c"]["enum"].append("injected")
+
+        self.assertEqual(default, ["a"])
+        self.assertEqual(input_["properties"]["b"]["properties"]["c"]["enum"], ["d"])
+
+    def test_flatten_deeply_nested(self):
+        input_ = node = {"type": "object", "title": "0", "properties": {}}
+        for i in range(1, 2 * sys.getrecursionlimit()):
+            child = {"type": "object", "title": str(i), "properties": {}}
+            node["properties"]["child"] = child
+            node = child
+
+        schema, definitions = flatten(input_, base="#/definitions")
+
+        self.assertEqual(schema, {"$ref": "#/definitions/0"})
+        self.assertEqual(len(definitions), 2 * sys.getrecursionlimit())
+        self.assertEqual(
+            definitions["0"]["properties"]["child"], {"$ref": "#/definitions/1"}
+        )
+
 
 class TestFormatPathForSwagger(unittest.TestCase):
     def test_format_path(self):
@@ -210,3 +274,22 @@ class TestFormatPathForSwagger(unittest.TestCase):
 
         self.assertEqual(res, "/health")
         self.assertEqual(args, tuple())
+
+
+class TestGetUniqueAuthenticators(unittest.TestCase):
+    def test_unique_by_identity_in_order_of_use(self):
+        first = HeaderApiKeyAuthenticator(header="x-first")
+        second = HeaderApiKeyAuthenticator(header="x-second")
+        default = HeaderApiKeyAuthenticator(header="x-default")
+
+        registry = Rebar().create_handler_registry(default_authenticators=default)
+
+        @registry.handles(rule="/foos", authenticators=[second, first])
+        def get_foos():
+            pass
+
+        @registry.handles(rule="/bars", authenticators=[first, default])
+        def get_bars():
+            pass
+
+        self.assertEqual(get_unique_authenticators(registry), [second, first, default])
@@ -37,6 +37,13 @@ class TestConverterRegistry(TestCase):
     def do_nothing(self):
         pass
 
+    def test_version_changes_when_registering(self):
+        version = self.registry.version
+
+        self.registry.register_types(ALL_CONVERTERS[:2])
+
+        self.assertEqual(self.registry.version, version + 2)
+
     def test_primitive_types(self):
         for field, result in [
             (m.fields.Integer(), {"type": "integer"}),
@@ -11,6 +11,7 @@ import json
 
 import marshmallow as m
 import pytest
+from flask import Flask
 
 from flask_rebar.rebar import Rebar
 from flask_rebar.swagger_generation import ExternalDocumentation
@@ -19,6 +20,9 @@ from flask_rebar.swagger_generation import SwaggerV3Generator
 from flask_rebar.swagger_generation import Server
 from flask_rebar.swagger_generation import ServerVariable
 from flask_rebar.swagger_generation import Tag
+from flask_rebar.swagger_generation.marshmallow_to_swagger import ALL_CONVERTERS
+from flask_rebar.swagger_generation.marshmallow_to_swagger import ConverterRegistry
+from flask_rebar.swagger_generation.marshmallow_to_swagger import StringConverter
 from flask_rebar.testing import validate_swagger
 from flask_rebar.testing.swagger_jsonschema import (
     SWAGGER_V2_JSONSCHEMA,
@@ -40,6 +44,18 @@ def _assert_dicts_equal(a, b):
     assert result == expected
 
 
+def _assert_is_tree(obj):
+    """Asserts that no dict or list appears more than once in `obj`"""
+    seen = set()
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, (dict, list)):
+            assert id(current) not in seen, current
+            seen.add(id(current))
+            stack.extend(current.values() if isinstance(current, dict) else current)
+
+
 def test_swagger_v2_generator_non_registry_parameters():
     host = "localhost"
     schemes = ["http"]
@@ -270,3 +286,286 @@ def test_swagger_generators(registry, swagger_generator, expected_swagger):
     expected = json.dumps(expected_swagger, indent=2, sort_keys=True)
 
     assert result == expected
+
+
+def test_swagger_v2_generator_caches_until_registry_changes():
+    rebar = Rebar()
+    registry = rebar.create_handler_registry()
+    generator = SwaggerV2Generator()
+
+    @registry.handles(rule="/foos", method="GET")
+    def get_foos():
+        pass
+
+    encoded = generator.generate_bytes(registry)
+    other_host = generator.generate_bytes(registry, host="example.com")
+
+    assert other_host is not encoded
+    assert generator.generate_bytes(registry) is encoded
+    assert generator.generate_bytes(registry, host="example.com") is other_host
+
+    @registry.handles(rule="/bars", method="GET")
+    def get_bars():
+        pass
+
+    regenerated = generator.generate_bytes(registry)
+
+    assert regenerated is not encoded
+    assert "/bars" in json.loads(regenerated.decode("utf-8"))["paths"]
+
+
+def test_swagger_v2_generator_cache_tracks_converters():
+    rebar = Rebar()
+    registry = rebar.create_handler_registry()
+    converter_registry = ConverterRegistry()
+    converter_registry.register_types(ALL_CONVERTERS)
+    generator = SwaggerV2Generator(response_converter_registry=converter_registry)
+
+    @registry.handles(rule="/foos/<custom:foo_uid>", method="GET")
+    def get_foo(foo_uid):
+        pass
+
+    encoded = generator.generate_bytes(registry)
+
+    generator.flask_converters_to_swagger_types["custom"] = "integer"
+    regenerated = generator.generate_bytes(registry)
+
+    assert regenerated is not encoded
+    assert generator.generate_bytes(registry) is regenerated
+
+    converter_registry.register_type(StringConverter())
+
+    assert generator.generate_bytes(registry) is not regenerated
+
+
+@pytest.mark.parametrize("generator", [SwaggerV2Generator(), SwaggerV3Generator()])
+def test_editing_generated_spec_does_not_change_schemas(generator):
+    rebar = Rebar()
+    registry = rebar.create_handler_registry()
+
+    class FooSchema(m.Schema):
+        tags = m.fields.List(m.fields.String(), missing=["a"])
+
+    @registry.handles(
+        rule="/foos",
+        method="GET",
+        query_string_schema=FooSchema(),
+        response_body_schema=FooSchema(),
+    )
+    def get_foos():
+        pass
+
+    swagger = generator.generate(registry, sort_keys=False)
+    if "definitions" in swagger:
+        definitions = swagger["definitions"]
+        parameter_schema = swagger["paths"]["/foos"]["get"]["parameters"][0]
+    else:
+        definitions = swagger["components"]["schemas"]
+        parameter_schema = swagger["paths"]["/foos"]["get"]["parameters"][0]["schema"]
+
+    definitions["FooSchema"]["properties"]["tags"]["default"].append("injected")
+    parameter_schema["default"].append("injected")
+
+    assert FooSchema().load({}) == {"tags": ["a"]}
+
+
+def test_swagger_v2_generator_does_not_cache_with_unversioned_registries():
+    class Registry(object):
+        def __init__(self):
+            self.registry = ConverterRegistry()
+            self.registry.register_types(ALL_CONVERTERS)
+
+        def convert(self, obj, openapi_version=2):
+            return self.registry.convert(obj, openapi_version=openapi_version)
+
+    rebar = Rebar()
+    registry = rebar.create_handler_registry()
+    generator = SwaggerV2Generator(response_converter_registry=Registry())
+
+    @registry.handles(rule="/foos", method="GET")
+    def get_foos():
+        pass
+
+    encoded = generator.generate_bytes(registry)
+
+    assert generator.generate_bytes(registry) is not encoded
+    assert generator.generate_bytes(registry) == encoded
+
+
+def test_swagger_v2_generator_builds_separate_response_definitions():
+    rebar = Rebar()
+    registry = rebar.create_handler_registry()
+    generator = SwaggerV2Generator()
+
+    class FooSchema(m.Schema):
+        uid = m.fields.String()
+
+    schema = FooSchema()
+    many_schema = FooSchema(many=True)
+
+    @registry.handles(rule="/foos/<foo_uid>", method="GET", response_body_schema=schema)
+    def get_foo(foo_uid):
+        pass
+
+    @registry.handles(
+        rule="/foos/<foo_uid>", method="PATCH", response_body_schema=schema
+    )
+    def update_foo(foo_uid):
+        pass
+
+    @registry.handles(rule="/foos", method="GET", response_body_schema=many_schema)
+    def list_foos():
+        pass
+
+    @registry.handles(rule="/foos", method="PUT", response_body_schema=many_schema)
+    def replace_foos():
+        pass
+
+    swagger = generator.generate(registry, sort_keys=False)
+
+    _assert_is_tree(swagger)
+    assert swagger["paths"]["/foos"]["get"]["responses"]["200"]["schema"] == {
+        "type": "array",
+        "items": {"$ref": "#/definitions/FooSchema"},
+    }
+
+
+def test_swagger_v2_generator_builds_separate_path_parameters():
+    rebar = Rebar()
+    registry = rebar.create_handler_registry()
+    generator = SwaggerV2Generator()
+
+    @registry.handles(rule="/foos/<int:foo_uid>", method="GET")
+    def get_foo(foo_uid):
+        pass
+
+    @registry.handles(rule="/foos/<int:foo_uid>/bars", method="GET")
+    def get_bars(foo_uid):
+        pass
+
+    swagger = generator.generate(registry, sort_keys=False)
+
+    _assert_is_tree(swagger)
+    assert swagger["paths"]["/foos/{foo_uid}/bars"]["parameters"] == [
+        {"name": "foo_uid", "required": True, "in": "path", "type": "integer"}
+    ]
+
+
+def test_swagger_v2_generator_returns_a_new_spec_every_time():
+    rebar = Rebar()
+    registry = rebar.create_handler_registry()
+    generator = SwaggerV2Generator()
+
+    @registry.handles(rule="/foos", method="GET")
+    def get_foos():
+        pass
+
+    swagger = generator.generate(registry)
+    swagger["x-extension"] = True
+
+    assert "x-extension" not in generator.generate(registry)
+    assert b"x-extension" not in generator.generate_bytes(registry)
+
+
+@pytest.mark.parametrize("generator", [SwaggerV2Generator(), SwaggerV3Generator()])
+def test_converters_memoize_per_schema(generator):
+    class FooSchema(m.Schema):
+        uid = m.fields.String()
+
+    schema = FooSchema()
+    converted = generator._response_converter(schema)
+
+    assert generator._response_converter(schema) is converted
+    assert generator._response_converter(FooSchema()) is not converted
+
+    generator._clear_converter_caches()
+
+    assert generator._response_converter(schema) is not converted
+
+
+@pytest.mark.parametrize("generator", [SwaggerV2Generator(), SwaggerV3Generator()])
+def test_memoized_conversions_are_not_shared_between_handlers(generator):
+    rebar = Rebar()
+    registry = rebar.create_handler_registry()
+
+    class FooSchema(m.Schema):
+        tags = m.fields.List(m.fields.String())
+
+    schema = FooSchema()
+
+    @registry.handles(
+        rule="/foos", method="GET", query_string_schema=schema, headers_schema=schema
+    )
+    def get_foos():
+        pass
+
+    @registry.handles(rule="/bars", method="GET", query_string_schema=schema)
+    def get_bars():
+        pass
+
+    _assert_is_tree(generator.generate(registry, sort_keys=False))
+
+
+def test_swagger_v2_generator_parameters_hook_can_be_overridden():
+    class Generator(SwaggerV2Generator):
+        def _convert_jsonschema_to_list_of_parameters(self, obj, in_="query"):
+            parameters = super(
+                Generator, self
+            )._convert_jsonschema_to_list_of_parameters(obj, in_=in_)
+            for parameter in parameters:
+                parameter["x-overridden"] = True
+            return parameters
+
+    rebar = Rebar()
+    registry = rebar.create_handler_registry()
+
+    class FooSchema(m.Schema):
+        uid = m.fields.String()
+
+    @registry.handles(rule="/foos", method="GET", query_string_schema=FooSchema())
+    def get_foos():
+        pass
+
+    swagger = Generator().generate(registry)
+
+    assert swagger["paths"]["/foos"]["get"]["parameters"][0]["x-overridden"]
+
+
+def test_swagger_v2_generator_caches_encoded_spec():
+    rebar = Rebar()
+    registry = rebar.create_handler_registry()
+    generator = SwaggerV2Generator()
+
+    @registry.handles(rule="/foos", method="GET")
+    def get_foos():
+        pass
+
+    encoded = generator.generate_bytes(registry)
+
+    assert json.loads(encoded.decode("utf-8")) == generator.generate(registry)
+    assert b", " not in encoded and b": " not in encoded
+    assert generator.generate_swagger_bytes(registry) is encoded
+    assert generator.generate_swagger_to_serve(registry) is (
+        generator.generate_swagger_to_serve(registry)
+    )
+
+    with Flask("other").app_context():
+        assert generator.generate_swagger_bytes(registry) is not encoded
+
+
+@pytest.mark.parametrize("generator", [SwaggerV2Generator(), SwaggerV3Generator()])
+def test_unknown_flask_converters_default_to_string(generator):
+    rebar = Rebar()
+    registry = rebar.create_handler_registry()
+
+    @registry.handles(rule="/foos/<custom:foo_uid>", method="GET")
+    def get_foo(foo_uid):
+        pass
+
+    swagger = generator.generate(registry)
+
+    (parameter,) = swagger["paths"]["/foos/{foo_uid}"]["parameters"]
+    if generator.get_open_api_version() == "2.0":
+        assert parameter["type"] == "string"
+    else:
+        assert parameter["schema"]["type"] == "string"
@@ -33,6 +33,7 @@ class TestErrors(unittest.TestCase):
     def setUp(self):
         self.app = self.create_app()
         self.app.response_class = make_test_response(self.app.response_class)
+        self.client = self.app.test_client()
 
     def create_app(self):
         app = Flask(__name__)
@@ -64,13 +65,13 @@ class TestErrors(unittest.TestCase):
         return app
 
     def test_custom_http_errors_are_handled(self):
-        resp = self.app.test_client().get("/errors")
+        resp = self.client.get("/errors")
         self.assertEqual(resp.status_code, 409)
         self.assertEqual(resp.content_type, "application/json")
         self.assertEqual(resp.json, TestErrors.ERROR_MSG._asdict())
 
     def test_custom_http_errors_can_have_additional_data(self):
-        resp = self.app.test_client().get("/verbose_errors")
+        resp = self.client.get("/verbose_errors")
         self.assertEqual(resp.status_code, 409)
         self.assertEqual(resp.content_type, "application/json")
         expected = TestErrors.ERROR_MSG._asdict()
@@ -81,20 +82,20 @@ class TestErrors(unittest.TestCase):
         rebar = self.app.extensions["rebar"]["instance"]
         # option 1: supply custom name for attribute in response
         rebar.error_code_attr = "xyz123"
-        resp = self.app.test_client().get("/errors")
+        resp = self.client.get("/errors")
         expected = TestErrors.ERROR_MSG._asdict()
         expected["xyz123"] = expected.pop("rebar_error_code")
         self.assertEqual(resp.json, expected)
 
         # option 2: suppress rebar-internal error codes entirely
         rebar.error_code_attr = None
-        resp = self.app.test_client().get("/errors")
+        resp = self.client.get("/errors")
         expected = TestErrors.ERROR_MSG._asdict()
         expected.pop("rebar_error_code")
         self.assertEqual(resp.json, expected)
 
     def test_default_400_errors_are_formatted_correctly(self):
-        resp = self.app.test_client().get("/route_that_fails_validation")
+        resp = self.client.get("/route_that_fails_validation")
         self.assertEqual(resp.status_code, 400)
         self.assertEqual(resp.content_type, "application/json")
         self.assertTrue(
@@ -102,7 +103,7 @@ class TestErrors(unittest.TestCase):
         )  # don't care about exact message wording, just existence
 
     def test_default_404_errors_are_formatted_correctly(self):
-        resp = self.app.test_client().get("/nonexistent")
+        resp = self.client.get("/nonexistent")
         self.assertEqual(resp.status_code, 404)
         self.assertEqual(resp.content_type, "application/json")
         self.assertTrue(
@@ -110,7 +111,7 @@ class TestErrors(unittest.TestCase):
         )  # don't care about exact message wording, just existence
 
     def test_default_405_errors_are_formatted_correctly(self):
-        resp = self.app.test_client().put("/errors")
+        resp = self.client.put("/errors")
         self.assertEqual(resp.status_code, 405)
         self.assertEqual(resp.content_type, "application/json")
         self.assertTrue(
@@ -118,7 +119,7 @@ class TestErrors(unittest.TestCase):
         )  # don't care about exact message wording, just existence
 
     def test_default_500_errors_are_formatted_correctly(self):
-        resp = self.app.test_client().get("/uncaught_errors")
+        resp = self.client.get("/uncaught_errors")
         self.assertEqual(resp.status_code, 500)
         self.assertEqual(resp.content_type, "application/json")
         self.assertEqual(resp.json, messages.internal_server_error._asdict())
@@ -129,25 +130,30 @@ class TestErrors(unittest.TestCase):
         with patch.object(self.app.logger, "error") as mock_logger, self.assertRaises(
             SystemExit
         ):
-            self.app.test_client().get("/slow")
+            self.client.get("/slow")
             mock_logger.error.assert_called_with(
                 "Exception on /slow [GET]", exc_info=ANY
             )
 
 
 class TestJsonBodyValidation(unittest.TestCase):
-    def setUp(self):
-        self.app = self.create_app()
-        self.app.response_class = make_test_response(self.app.response_class)
+    # Nothing here modifies the app, so it's only built once for all tests
+    @classmethod
+    def setUpClass(cls):
+        super(TestJsonBodyValidation, cls).setUpClass()
+        cls.app = cls.create_app()
+        cls.app.response_class = make_test_response(cls.app.response_class)
+        cls.client = cls.app.test_client()
 
     def post_json(self, path, data):
-        return self.app.test_client().post(
+        return self.client.post(
             path=path,
             data=json.dumps(data),
             headers={"Content-Type": "application/json"},
         )
 
-    def create_app(self):
+    @classmethod
+    def create_app(cls):
         app = Flask(__name__)
         Rebar().init_app(app=app)
 
@@ -167,13 +173,13 @@ class TestJsonBodyValidation(unittest.TestCase):
         return app
 
     def test_json_encoding_validation(self):
-        resp = self.app.test_client().post(
+        resp = self.client.post(
             path="/stuffs", headers={"Content-Type": "application/json"}
         )
         self.assertEqual(resp.status_code, 400)
         self.assertEqual(resp.json, messages.empty_json_body._asdict())
 
-        resp = self.app.test_client().post(
+        resp = self.client.post(
             path="/stuffs",
             data=json.dumps({"foo": 1}),
             headers={"Content-Type": "text/csv"},
@@ -181,7 +187,7 @@ class TestJsonBodyValidation(unittest.TestCase):
         self.assertEqual(resp.status_code, 400)
         self.assertEqual(resp.json, messages.unsupported_content_type._asdict())
 
-        resp = self.app.test_client().post(
+        resp = self.client.post(
             path="/stuffs",
             data="not valid json",
             headers={"Content-Type": "application/json"},
@@ -253,7 +259,7 @@ class TestJsonBodyValidation(unittest.TestCase):
         self.assertEqual(resp.json, expected)
 
     def test_invalid_json_error(self):
-        resp = self.app.test_client().post(
+        resp = self.client.post(
             path="/stuffs",
             data='"Im technically valid JSON, but not an object"',
             headers={"Content-Type": "application/json"},
@@ -263,11 +269,16 @@ class TestJsonBodyValidation(unittest.TestCase):
 
 
 class TestQueryStringValidation(unittest.TestCase):
-    def setUp(self):
-        self.app = self.create_app()
-        self.app.response_class = make_test_response(self.app.response_class)
-
-    def create_app(self):
+    # Nothing here modifies the app, so it's only built once for all tests
+    @classmethod
+    def setUpClass(cls):
+        super(TestQueryStringValidation, cls).setUpClass()
+        cls.app = cls.create_app()
+        cls.app.response_class = make_test_response(cls.app.response_class)
+        cls.client = cls.app.test_client()
+
+    @classmethod
+    def create_app(cls):
         app = Flask(__name__)
         Rebar().init_app(app=app)
 
@@ -284,26 +295,26 @@ class TestQueryStringValidation(unittest.TestCase):
         return app
 
     def test_query_string_parameter_validation(self):
-        resp = self.app.test_client().get(path="/stuffs?foo=one")
+        resp = self.client.get(path="/stuffs?foo=one")
         expected = messages.query_string_validation_failed._asdict()
         expected["errors"] = {"foo": "Not a valid integer."}
         self.assertEqual(resp.status_code, 400)
         self.assertEqual(resp.json, expected)
 
-        resp = self.app.test_client().get(path="/stuffs?bar=true")
+        resp = self.client.get(path="/stuffs?bar=true")
         expected = messages.query_string_validation_failed._asdict()
         expected["errors"] = {"foo": "Missing data for required field."}
 
         self.assertEqual(resp.status_code, 400)
         self.assertEqual(resp.json, expected)
 
-        resp = self.app.test_client().get(path="/stuffs?foo=1&unexpected=true")
+        resp = self.client.get(path="/stuffs?foo=1&unexpected=true")
         expected = messages.query_string_validation_failed._asdict()
         expected["errors"] = {"unexpected": "Unknown field."}
 
         self.assertEqual(resp.status_code, 400)
         self.assertEqual(resp.json, expected)
 
-        resp = self.app.test_client().get(path="/stuffs?foo=1&bar=true&baz=1,2,3")
+        resp = self.client.get(path="/stuffs?foo=1&bar=true&baz=1,2,3")
         self.assertEqual(resp.status_code, 200)
         self.assertEqual(resp.json, {"foo": 1, "bar": True, "baz": [1, 2, 3]})
@@ -396,7 +396,7 @@ class RebarTest(unittest.TestCase):
         resp = app.test_client().delete(path="/me")
 
         self.assertEqual(resp.status_code, 204)
-        self.assertEqual(resp.data.decode("utf-8"), "")
+        self.assertEqual(resp.data, b"")
         self.assertEqual(resp.headers["Content-Type"], "content/type")
 
     def test_default_mimetype_for_non_null_response_schema(self):
@@ -413,7 +413,7 @@ class RebarTest(unittest.TestCase):
         resp = app.test_client().delete(path="/me")
 
         self.assertEqual(resp.status_code, 204)
-        self.assertEqual(resp.data.decode("utf-8"), "")
+        self.assertEqual(resp.data, b"")
         self.assertEqual(resp.headers["Content-Type"], "content/type")
 
     def test_handler_mimetype_for_null_response_schema(self):
@@ -433,7 +433,7 @@ class RebarTest(unittest.TestCase):
         resp = app.test_client().delete(path="/me")
 
         self.assertEqual(resp.status_code, 204)
-        self.assertEqual(resp.data.decode("utf-8"), "")
+        self.assertEqual(resp.data, b"")
         self.assertEqual(resp.headers["Content-Type"], "content/type")
 
     def test_handler_mimetype_for_non_null_response_schema(self):
@@ -453,7 +453,7 @@ class RebarTest(unittest.TestCase):
         resp = app.test_client().delete(path="/me")
 
         self.assertEqual(resp.status_code, 204)
-        self.assertEqual(resp.data.decode("utf-8"), "")
+        self.assertEqual(resp.data, b"")
         self.assertEqual(resp.headers["Content-Type"], "content/type")
 
     def test_handler_mimetype_overrides_default_mimetype(self):
@@ -473,7 +473,7 @@ class RebarTest(unittest.TestCase):
         resp = app.test_client().delete(path="/me")
 
         self.assertEqual(resp.status_code, 204)
-        self.assertEqual(resp.data.decode("utf-8"), "")
+        self.assertEqual(resp.data, b"")
         self.assertEqual(resp.headers["Content-Type"], "handler/type")
 
     @parametrize("foo_definition", [(FooSchema,), (FooModel,)])
@@ -545,6 +545,36 @@ class RebarTest(unittest.TestCase):
 
         validate_swagger(resp.json)
 
+    def test_swagger_endpoint_uses_app_json_mimetype(self):
+        rebar = Rebar()
+        rebar.create_handler_registry()
+        app = create_rebar_app(rebar)
+        if hasattr(app, "json"):
+            app.json.mimetype = "application/vnd.api+json"
+        else:
+            app.config["JSONIFY_MIMETYPE"] = "application/vnd.api+json"
+
+        resp = app.test_client().get("/swagger")
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.mimetype, "application/vnd.api+json")
+
+    def test_swagger_endpoint_is_pretty_printed_in_debug_mode(self):
+        rebar = Rebar()
+        rebar.create_handler_registry()
+        app = create_rebar_app(rebar)
+        app.debug = True
+
+        resp = app.test_client().get("/swagger")
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertIn(b'\n  "', resp.data)
+
+        app.debug = False
+        resp = app.test_client().get("/swagger")
+
+        self.assertNotIn(b'\n  "', resp.data)
+
     def test_swagger_ui_endpoint_is_automatically_created(self):
         rebar = Rebar()
         rebar.create_handler_registry()